@@ -1,13 +1,16 @@
 import os
-import json
-import pandas as pd
+import csv
+import io
+import orjson
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
 from pathlib import Path
 from tqdm import tqdm
 import multiprocessing as mp
 from functools import partial
 import numpy as np
-from typing import Dict, List, Any, Optional
-import hashlib
+from typing import Dict, List, Any, Optional, Tuple
 
 # Types for our data structure
 class NodeType:
@@ -17,19 +20,111 @@ class NodeType:
     CLUSTER = 'cluster'
     KEYWORDS = 'keywords'
 
+# Metadata fields every cluster file header must provide
+REQUIRED_METADATA = frozenset([
+    'centroid_keywords',
+    'tfidf_keywords',
+    'cluster_size',
+    'keyword_diversity_samples'
+])
+
+# Cluster CSV columns every file must provide
+REQUIRED_COLUMNS = [
+    'keyword',
+    'Semrush_Search Volume',
+    'Semrush_Keyword Difficulty',
+    'Semrush_CPC (USD)'
+]
+
+# Numbers Arrow can cast from text, plus infinities so their rows can be dropped;
+# anything else in a Semrush metric cell (including nan) counts as 0
+NUMERIC_PATTERN = r'^[+-]?(\d+\.?\d*|\.\d+)(e[+-]?\d+)?$|^[+-]?inf(inity)?$'
+
 def validate_metadata(metadata: Dict[str, Any]) -> bool:
     """Validate metadata structure and content"""
-    required_fields = ['centroid_keywords', 'tfidf_keywords', 'cluster_size', 'keyword_diversity_samples']
-    return all(field in metadata and metadata[field] is not None for field in required_fields)
+    return REQUIRED_METADATA.issubset(metadata) and not any(metadata[field] is None for field in REQUIRED_METADATA)
+
+def empty_keyword_columns() -> Dict[str, np.ndarray]:
+    """Keyword columns for a cluster node without keywords"""
+    return {
+        'keyword': np.empty(0, dtype=object),
+        'searchVolume': np.empty(0, dtype=np.int64),
+        'keywordDifficulty': np.empty(0, dtype=np.float32),
+        'cpc': np.empty(0, dtype=np.float32)
+    }
 
-def validate_keyword(keyword_data: Dict[str, Any]) -> bool:
-    """Validate keyword data structure and content"""
-    required_fields = ['keyword', 'searchVolume', 'keywordDifficulty', 'cpc']
-    return all(field in keyword_data and keyword_data[field] is not None for field in required_fields)
+def keyword_records(columns: Dict[str, np.ndarray]) -> List[Dict[str, Any]]:
+    """Rebuild the per-keyword dicts written to the output from keyword columns"""
+    # KD and CPC stay numpy float32 scalars; orjson writes them in their
+    # shortest float32 form (3.21, not 3.2100000381469727)
+    return [
+        {
+            'keyword': k,
+            'searchVolume': sv,
+            'keywordDifficulty': kd,
+            'cpc': c
+        }
+        for k, sv, kd, c in zip(
+            columns['keyword'].tolist(),
+            columns['searchVolume'].tolist(),
+            columns['keywordDifficulty'],
+            columns['cpc']
+        )
+    ]
 
-def calculate_data_hash(data: Dict[str, Any]) -> str:
-    """Calculate a hash of the data for integrity checking"""
-    return hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+def flatten_keyword_columns(nodes: List[Dict[str, Any]]) -> None:
+    """Replace cluster keyword columns with per-keyword dicts, in place, for JSON output"""
+    stack = list(nodes)
+    while stack:
+        node = stack.pop()
+        if node.get('type') == NodeType.CLUSTER:
+            node['keywords'] = keyword_records(node['keywords'])
+        else:
+            stack.extend(node.get('children', []))
+
+def parse_semrush_numeric(column: pa.ChunkedArray) -> np.ndarray:
+    """Parse a Semrush count column with thousands separators ("1,200") into int64"""
+    digits = pc.replace_substring(pc.utf8_trim_whitespace(column), ',', '')
+    digits = pc.if_else(pc.equal(digits, ''), '0', digits)
+    try:
+        # Counts are normally whole numbers, so parse them straight to int64
+        counts = pc.cast(digits, pa.int64())
+        if counts.null_count == 0:
+            return counts.to_numpy()
+    except pa.ArrowInvalid:
+        pass
+    
+    # Fall back to truncating decimal values such as "12.0", refusing values
+    # (nan, inf, missing cells, out of range) that have no int64 equivalent
+    values = pc.cast(digits, pa.float64()).to_numpy(zero_copy_only=False)
+    if not (np.isfinite(values) & (np.abs(values) < 2.0 ** 63)).all():
+        raise ValueError("Search volume contains values that are not finite int64 numbers")
+    return values.astype(np.int64)
+
+def parse_semrush_float(column: pa.ChunkedArray) -> np.ndarray:
+    """Parse a Semrush decimal column into float32, treating empty or non-numeric cells as 0"""
+    values = pc.utf8_trim_whitespace(column)
+    numeric = pc.match_substring_regex(values, NUMERIC_PATTERN, ignore_case=True)
+    values = pc.if_else(numeric, values, pa.scalar(None, pa.string()))
+    return pc.cast(values, pa.float32()).fill_null(0).to_numpy()
+
+def read_padded_table(text: str) -> pa.Table:
+    """Parse cluster CSV text with the csv module, padding short rows with empty cells like pandas did"""
+    rows = csv.reader(io.StringIO(text))
+    header = next(rows)
+    indices = [header.index(column) for column in REQUIRED_COLUMNS]
+    columns = [[] for _ in REQUIRED_COLUMNS]
+    for row in rows:
+        if not row:
+            continue
+        if len(row) > len(header):
+            raise ValueError(f"Expected {len(header)} columns, got {len(row)}")
+        for values, index in zip(columns, indices):
+            values.append(row[index] if index < len(row) else '')
+    return pa.table({
+        column: pa.array(values, type=pa.string())
+        for column, values in zip(REQUIRED_COLUMNS, columns)
+    })
 
 def read_csv_keywords(file_path: str) -> Dict[str, Any]:
     """Read CSV file and get keywords and search volume"""
@@ -38,9 +133,14 @@ def read_csv_keywords(file_path: str) -> Dict[str, Any]:
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"File not found: {file_path}")
         
-        # Read the first 5 lines for metadata
-        with open(file_path, 'r', encoding='utf-8') as f:
-            lines = [next(f) for _ in range(5)]
+        # Read the file once as bytes; the first 4 lines hold the metadata
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        
+        metadata_end = 0
+        for _ in range(4):
+            metadata_end = raw.index(b'\n', metadata_end) + 1
+        lines = raw[:metadata_end].decode('utf-8').splitlines()
         
         # Extract and validate metadata
         metadata = {
@@ -52,84 +152,89 @@ def read_csv_keywords(file_path: str) -> Dict[str, Any]:
         
         if not validate_metadata(metadata):
             raise ValueError(f"Invalid metadata in file: {file_path}")
-
-        # Read CSV data using row 5 as header (after 4 metadata rows)
-        df = pd.read_csv(
-            file_path,
-            skiprows=4,
-            header=0,
-            encoding='utf-8',
-            dtype=str,
-            engine='c',
-            na_filter=False,
-            memory_map=True
-        )
         
-        # Verify required columns exist
-        required_columns = [
-            'keyword',
-            'Semrush_Search Volume',
-            'Semrush_Keyword Difficulty',
-            'Semrush_CPC (USD)'
-        ]
-        missing_columns = [col for col in required_columns if col not in df.columns]
+        # Verify required columns exist in the header row
+        header_end = raw.find(b'\n', metadata_end)
+        header_line = raw[metadata_end:header_end if header_end != -1 else len(raw)].decode('utf-8')
+        header = next(csv.reader([header_line.rstrip('\r')]), [])
+        missing_columns = [col for col in REQUIRED_COLUMNS if col not in header]
         if missing_columns:
             raise ValueError(f"Missing required columns in {file_path}: {missing_columns}")
+
+        # Note rows with missing trailing cells so the file can be re-read with
+        # padding below; rows with extra cells still fail the file, as they did before
+        short_rows = []
+        
+        def note_short_row(row: pacsv.InvalidRow) -> str:
+            if row.actual_columns < row.expected_columns:
+                short_rows.append(row.number)
+                return 'skip'
+            return 'error'
+        
+        # Read CSV data from the bytes already in memory, using row 5 as header.
+        # Only the required columns are converted, all as text, so that one
+        # malformed metric cell is coerced below rather than failing the file.
+        table = pacsv.read_csv(
+            pa.BufferReader(memoryview(raw)[metadata_end:]),
+            read_options=pacsv.ReadOptions(use_threads=False),
+            parse_options=pacsv.ParseOptions(invalid_row_handler=note_short_row),
+            convert_options=pacsv.ConvertOptions(
+                column_types={column: pa.string() for column in REQUIRED_COLUMNS},
+                include_columns=REQUIRED_COLUMNS,
+                strings_can_be_null=False
+            )
+        )
+        if short_rows:
+            table = read_padded_table(raw[metadata_end:].decode('utf-8'))
         
-        # Process keywords with vectorized operations where possible
-        keywords = []
+        # Trim keywords and order rows alphabetically (case-insensitive) up front,
+        # lowering the whole column once in Arrow rather than per keyword
+        keyword_column = pc.utf8_trim_whitespace(table.column('keyword'))
+        table = table.set_column(table.column_names.index('keyword'), 'keyword', keyword_column)
+        table = table.take(pc.sort_indices(pc.utf8_lower(keyword_column)))
         
-        # Convert numeric columns in bulk with validation
+        # Convert numeric columns in bulk with validation; empty or non-numeric KD/CPC cells become 0
         try:
-            search_volumes = df['Semrush_Search Volume'].str.replace(',', '').replace('', '0').astype(float).astype(int)
-            keyword_difficulties = pd.to_numeric(df['Semrush_Keyword Difficulty'].replace('', '0'), errors='coerce').fillna(0)
-            cpcs = pd.to_numeric(df['Semrush_CPC (USD)'].replace('', '0'), errors='coerce').fillna(0)
+            search_volumes = parse_semrush_numeric(table.column('Semrush_Search Volume'))
         except Exception as e:
             raise ValueError(f"Error converting numeric columns in {file_path}: {str(e)}")
-        
-        # Process each row with validation
-        for idx, row in df.iterrows():
-            try:
-                keyword = str(row['keyword']).strip()
-                if keyword:
-                    keyword_data = {
-                        'keyword': keyword,
-                        'searchVolume': int(search_volumes[idx]),
-                        'keywordDifficulty': float(keyword_difficulties[idx]),
-                        'cpc': float(cpcs[idx]),
-                        'funnelStage': row.get('Semrush_Funnel Stage', ''),
-                        'searchIntent': row.get('Semrush_Search Intent', ''),
-                        'level4_cluster': row.get('level4_cluster', ''),
-                        'category': row.get('category', '')
-                    }
-                    
-                    if validate_keyword(keyword_data):
-                        keywords.append(keyword_data)
-                    else:
-                        print(f"Warning: Invalid keyword data in row {idx} of {file_path}")
-            except Exception as e:
-                print(f"Error processing row {idx} in {file_path}: {str(e)}")
-                continue
+        keyword_difficulties = parse_semrush_float(table.column('Semrush_Keyword Difficulty'))
+        cpcs = parse_semrush_float(table.column('Semrush_CPC (USD)'))
+        
+        # Extract columns once and drop rows with an empty keyword or an
+        # infinite KD/CPC (which would be written as invalid JSON) with a single mask
+        kw_arr = table.column('keyword').to_numpy(zero_copy_only=False)
+        has_keyword = kw_arr != ''
+        finite_metrics = np.isfinite(keyword_difficulties) & np.isfinite(cpcs)
+        mask = has_keyword & finite_metrics
+        infinite_rows = int((has_keyword & ~finite_metrics).sum())
+        if infinite_rows:
+            print(f"Warning: Skipped {infinite_rows} rows with infinite KD/CPC values in {file_path}")
+        search_volumes = search_volumes[mask]
+        keyword_difficulties = keyword_difficulties[mask]
+        cpcs = cpcs[mask]
+        
+        # Keywords are stored column-wise, one array per field
+        keywords = {
+            'keyword': kw_arr[mask],
+            'searchVolume': search_volumes,
+            'keywordDifficulty': keyword_difficulties,
+            'cpc': cpcs
+        }
 
-        # Calculate total search volume
-        total_search_volume = sum(k['searchVolume'] for k in keywords)
-        
         result = {
             'keywords': keywords,
-            'totalKeywords': len(keywords),
-            'totalSearchVolume': total_search_volume,
+            'totalKeywords': len(search_volumes),
+            'totalSearchVolume': int(search_volumes.sum()),
             'metadata': metadata
         }
         
-        # Add data integrity hash
-        result['data_hash'] = calculate_data_hash(result)
-        
         return result
     except Exception as e:
         print(f"Error reading CSV file {file_path}:")
         print(f"Full error details: {str(e)}")
         return {
-            'keywords': [],
+            'keywords': empty_keyword_columns(),
             'totalKeywords': 0,
             'totalSearchVolume': 0,
             'metadata': {
@@ -137,45 +242,30 @@ def read_csv_keywords(file_path: str) -> Dict[str, Any]:
                 'tfidf_keywords': '',
                 'cluster_size': 0,
                 'keyword_diversity_samples': ''
-            },
-            'data_hash': calculate_data_hash({'keywords': [], 'totalKeywords': 0, 'totalSearchVolume': 0})
+            }
         }
 
-def process_cluster_file(cluster_path: str) -> Dict[str, Any]:
-    """Process a single cluster file"""
+def process_cluster_file(cluster_path: str, path_info: Tuple[str, str, Optional[str], str]) -> Dict[str, Any]:
+    """Process a single cluster file given its (pillar, parent, subtopic, cluster) names"""
+    # Build hierarchy information
+    pillar, parent, subtopic, cluster = path_info
+    hierarchy = {
+        'pillar': pillar,
+        'parent': parent,
+        'subtopic': subtopic,
+        'cluster': cluster
+    }
+    
     try:
         cluster_data = read_csv_keywords(cluster_path)
         
-        # Extract path components to maintain hierarchy information
-        path_parts = Path(cluster_path).parts
-        cluster_index = path_parts.index('3.1 Qualified Clusters')
+        # Reduce the keyword columns directly
+        columns = cluster_data['keywords']
+        total_search_volume = int(columns['searchVolume'].sum())
+        total_kd = float(columns['keywordDifficulty'].sum(dtype=np.float64))
+        total_cpc = float(columns['cpc'].sum(dtype=np.float64))
         
-        # Build hierarchy information
-        hierarchy = {
-            'pillar': path_parts[cluster_index + 1],
-            'parent': path_parts[cluster_index + 2],
-            'subtopic': path_parts[cluster_index + 3] if len(path_parts) > cluster_index + 3 else None,
-            'cluster': path_parts[-1].replace('.csv', '')
-        }
-        
-        # Transform keywords to match expected format
-        transformed_keywords = []
-        total_search_volume = 0
-        total_kd = 0
-        total_cpc = 0
-        
-        for kw in cluster_data['keywords']:
-            transformed_keywords.append({
-                'keyword': kw['keyword'],
-                'searchVolume': kw['searchVolume'],
-                'keywordDifficulty': kw['keywordDifficulty'],
-                'cpc': kw['cpc']
-            })
-            total_search_volume += kw['searchVolume']
-            total_kd += kw['keywordDifficulty']
-            total_cpc += kw['cpc']
-        
-        total_keywords = len(transformed_keywords)
+        total_keywords = len(columns['keyword'])
         avg_kd = total_kd / total_keywords if total_keywords > 0 else 0
         avg_cpc = total_cpc / total_keywords if total_keywords > 0 else 0
         
@@ -184,7 +274,7 @@ def process_cluster_file(cluster_path: str) -> Dict[str, Any]:
             'type': NodeType.CLUSTER,
             'hierarchy': hierarchy,
             'metadata': cluster_data['metadata'],
-            'keywords': transformed_keywords,
+            'keywords': columns,
             'size': total_search_volume,
             'totalKeywords': total_keywords,
             'totalClusters': 1,
@@ -195,26 +285,9 @@ def process_cluster_file(cluster_path: str) -> Dict[str, Any]:
         return result
     except Exception as e:
         print(f"Error processing cluster file {cluster_path}: {str(e)}")
-        try:
-            path_parts = Path(cluster_path).parts
-            cluster_index = path_parts.index('3.1 Qualified Clusters')
-            hierarchy = {
-                'pillar': path_parts[cluster_index + 1] if len(path_parts) > cluster_index + 1 else 'Unknown',
-                'parent': path_parts[cluster_index + 2] if len(path_parts) > cluster_index + 2 else 'Unknown',
-                'subtopic': path_parts[cluster_index + 3] if len(path_parts) > cluster_index + 3 else None,
-                'cluster': Path(cluster_path).stem
-            }
-        except ValueError:
-            # Fallback if the directory structure is different
-            hierarchy = {
-                'pillar': 'Unknown',
-                'parent': 'Unknown', 
-                'subtopic': None,
-                'cluster': Path(cluster_path).stem
-            }
         
         return {
-            'name': Path(cluster_path).stem,
+            'name': cluster,
             'type': NodeType.CLUSTER,
             'hierarchy': hierarchy,
             'metadata': {
@@ -223,7 +296,7 @@ def process_cluster_file(cluster_path: str) -> Dict[str, Any]:
                 'cluster_size': 0,
                 'keyword_diversity_samples': ''
             },
-            'keywords': [],
+            'keywords': empty_keyword_columns(),
             'size': 0,
             'totalKeywords': 0,
             'totalClusters': 0,
@@ -231,69 +304,71 @@ def process_cluster_file(cluster_path: str) -> Dict[str, Any]:
             'averageCPC': 0
         }
 
+# Order of the cluster node fields sent back from worker processes
+CLUSTER_FIELDS = (
+    'name',
+    'type',
+    'hierarchy',
+    'metadata',
+    'keywords',
+    'size',
+    'totalKeywords',
+    'totalClusters',
+    'averageKD',
+    'averageCPC'
+)
+
+def _init_worker():
+    """Keep Arrow single-threaded inside each worker process"""
+    pa.set_cpu_count(1)
+    pa.set_io_thread_count(1)
+
+def _process_cluster_task(task: Tuple[str, Tuple[str, str, Optional[str], str]]) -> tuple:
+    """Process a cluster file in a worker and return its path and fields as a tuple"""
+    cluster_path, path_info = task
+    # Keywords travel back as column arrays, which pickle as flat buffers
+    # instead of one dict per keyword
+    result = process_cluster_file(cluster_path, path_info)
+    return cluster_path, tuple(result[field] for field in CLUSTER_FIELDS)
+
 def aggregate_node_metrics(node: Dict[str, Any]) -> Dict[str, Any]:
-    """Aggregate metrics from a node and its children"""
+    """Aggregate metrics from a node's children into the node, in a single post-order pass"""
+    # Cluster nodes already carry the metrics computed in process_cluster_file
+    if node.get('type') == NodeType.CLUSTER:
+        return node
+    
     # Initialize metrics
     total_search_volume = 0
     total_keywords = 0
     total_clusters = 0
-    total_kd = 0
-    total_cpc = 0
-    all_keywords = []
+    total_kd = 0.0
+    total_cpc = 0.0
     
-    # If it's a cluster node, use its own metrics
-    if node.get('type') == NodeType.CLUSTER:
-        if node.get('keywords'):
-            all_keywords = node['keywords']
-            total_search_volume = sum(kw['searchVolume'] for kw in all_keywords)
-            total_keywords = len(all_keywords)
-            total_kd = sum(kw['keywordDifficulty'] for kw in all_keywords)
-            total_cpc = sum(kw['cpc'] for kw in all_keywords)
-            total_clusters = 1
-    # For non-cluster nodes, aggregate from children
-    elif node.get('children'):
-        for child in node['children']:
-            # Recursively aggregate child metrics
-            child_metrics = aggregate_node_metrics(child)
-            
-            # Add child metrics to totals
-            total_search_volume += child_metrics['size']
-            total_keywords += child_metrics['totalKeywords']
-            total_clusters += child_metrics['totalClusters']
-            total_kd += child_metrics['averageKD'] * child_metrics['totalKeywords']
-            total_cpc += child_metrics['averageCPC'] * child_metrics['totalKeywords']
-            
-            # Collect keywords if this is a cluster node
-            if child_metrics.get('keywords'):
-                all_keywords.extend(child_metrics['keywords'])
-    
-    # Calculate averages
-    avg_kd = total_kd / total_keywords if total_keywords > 0 else 0
-    avg_cpc = total_cpc / total_keywords if total_keywords > 0 else 0
-    
-    # Prepare the result with the calculated metrics
-    result = {
-        **node,
-        'size': total_search_volume,
-        'totalKeywords': total_keywords,
-        'totalClusters': total_clusters,
-        'averageKD': avg_kd,
-        'averageCPC': avg_cpc
-    }
+    for child in node.get('children', []):
+        if child.get('type') == NodeType.CLUSTER:
+            # Clusters without keywords don't count towards their parents
+            if not child['totalKeywords']:
+                continue
+            total_clusters += 1
+        else:
+            aggregate_node_metrics(child)
+            total_clusters += child['totalClusters']
+        
+        # Add child metrics to totals
+        total_search_volume += child['size']
+        total_keywords += child['totalKeywords']
+        total_kd += child['averageKD'] * child['totalKeywords']
+        total_cpc += child['averageCPC'] * child['totalKeywords']
     
-    # Handle keywords display based on node type
-    if node.get('type') == NodeType.CLUSTER:
-        # For cluster nodes, use all keywords and sort them alphabetically
-        # Sort keywords alphabetically
-        result['keywords'] = sorted(all_keywords, key=lambda x: x['keyword'].lower())
-    else:
-        # For non-cluster nodes, don't include keywords
-        result['keywords'] = []
-        # Keep the children for non-cluster nodes
-        if node.get('children'):
-            result['children'] = node['children']
+    # Store the metrics on the node; non-cluster nodes don't include keywords
+    node['size'] = total_search_volume
+    node['totalKeywords'] = total_keywords
+    node['totalClusters'] = total_clusters
+    node['averageKD'] = total_kd / total_keywords if total_keywords > 0 else 0
+    node['averageCPC'] = total_cpc / total_keywords if total_keywords > 0 else 0
+    node['keywords'] = []
     
-    return result
+    return node
 
 def build_data_structure(base_path: str) -> Dict[str, Any]:
     """Build the data structure from the folder"""
@@ -303,12 +378,39 @@ def build_data_structure(base_path: str) -> Dict[str, Any]:
         error_files = 0
         structure_log = []  # Track the structure variations we find
         
-        # First, collect all CSV files to process
+        # Collect all CSV files to process and record the folder layout in the
+        # same walk: pillar -> parent -> {has_subtopics, clusters, subtopics}.
+        # Each file is queued with its hierarchy names so workers never parse paths.
         all_csv_files = []
-        for root, _, files in os.walk(base_path):
+        tasks = []
+        layout = {}
+        for root, dirs, files in os.walk(base_path):
+            rel_parts = Path(root).relative_to(base_path).parts
+            pillar_topic = rel_parts[0] if len(rel_parts) > 0 else 'Unknown'
+            parent_topic = rel_parts[1] if len(rel_parts) > 1 else 'Unknown'
+            sub_item = rel_parts[2] if len(rel_parts) > 2 else None
+            
+            csv_files = []
             for file in files:
                 if file.endswith('.csv'):
-                    all_csv_files.append(os.path.join(root, file))
+                    csv_file = os.path.join(root, file)
+                    csv_files.append(csv_file)
+                    tasks.append((csv_file, (pillar_topic, parent_topic, sub_item, file[:-len('.csv')])))
+            all_csv_files.extend(csv_files)
+            
+            if any(part.startswith('.') for part in rel_parts):
+                continue
+            
+            if len(rel_parts) == 1:
+                layout[rel_parts[0]] = {}
+            elif len(rel_parts) == 2:
+                layout[pillar_topic][parent_topic] = {
+                    'has_subtopics': bool(dirs),
+                    'clusters': csv_files,
+                    'subtopics': {}
+                }
+            elif len(rel_parts) == 3:
+                layout[pillar_topic][parent_topic]['subtopics'][sub_item] = csv_files
         
         if not all_csv_files:
             raise ValueError(f"No CSV files found in {base_path}")
@@ -316,34 +418,29 @@ def build_data_structure(base_path: str) -> Dict[str, Any]:
         # Create single global progress bar
         pbar = tqdm(total=len(all_csv_files), desc="Processing cluster files")
         
-        # Create a pool of workers
+        # Create a pool of workers, recycled periodically to keep memory in check
         num_cores = mp.cpu_count()
-        pool = mp.Pool(processes=num_cores)
+        pool = mp.Pool(processes=num_cores, initializer=_init_worker, maxtasksperchild=100)
         
-        # Process files in parallel
+        # Process files in parallel, handing each worker batches of files
+        chunksize = max(1, len(all_csv_files) // (num_cores * 4))
         results = {}
-        for result in pool.imap_unordered(process_cluster_file, all_csv_files):
+        for cluster_path, fields in pool.imap_unordered(_process_cluster_task, tasks, chunksize=chunksize):
+            result = dict(zip(CLUSTER_FIELDS, fields))
             pbar.update(1)
-            if result['keywords']:  # Check if we have any keywords
+            if result['totalKeywords']:  # Check if we have any keywords
                 processed_files += 1
             else:
                 error_files += 1
             # Store result with its path for later organization
-            results[result['name']] = result
+            results[cluster_path] = result
         
         pool.close()
         pool.join()
         pbar.close()
         
         # Organize results into the hierarchical structure (quietly)
-        for pillar_topic in os.listdir(base_path):
-            if pillar_topic.startswith('.'):
-                continue
-            
-            pillar_path = os.path.join(base_path, pillar_topic)
-            if not os.path.isdir(pillar_path):
-                continue
-            
+        for pillar_topic, parents in layout.items():
             pillar_node = {
                 'name': pillar_topic,
                 'type': NodeType.PILLAR,
@@ -351,22 +448,14 @@ def build_data_structure(base_path: str) -> Dict[str, Any]:
             }
             
             # Process each level with validation
-            for parent_topic in os.listdir(pillar_path):
-                if parent_topic.startswith('.'):
-                    continue
-                
-                parent_path = os.path.join(pillar_path, parent_topic)
-                if not os.path.isdir(parent_path):
-                    continue
-                
+            for parent_topic, parent_layout in parents.items():
                 parent_node = {
                     'name': parent_topic,
                     'type': NodeType.PARENT,
                     'children': []
                 }
                 
-                sub_items = os.listdir(parent_path)
-                has_subtopics = any(os.path.isdir(os.path.join(parent_path, item)) for item in sub_items)
+                has_subtopics = parent_layout['has_subtopics']
                 
                 # Log the structure variation we found
                 structure_path = f"{pillar_topic} -> {parent_topic}"
@@ -375,51 +464,24 @@ def build_data_structure(base_path: str) -> Dict[str, Any]:
                 structure_log.append(structure_path)
                 
                 if has_subtopics:
-                    for sub_item in sub_items:
-                        if sub_item.startswith('.'):
-                            continue
-                        
-                        sub_path = os.path.join(parent_path, sub_item)
-                        if not os.path.isdir(sub_path):
-                            continue
-                        
+                    for sub_item, cluster_files in parent_layout['subtopics'].items():
                         sub_node = {
                             'name': sub_item,
                             'type': NodeType.SUBTOPIC,
-                            'children': []
+                            'children': [results[cluster_file] for cluster_file in cluster_files]
                         }
                         
-                        for cluster_file in os.listdir(sub_path):
-                            if not cluster_file.endswith('.csv'):
-                                continue
-                            
-                            cluster_name = cluster_file.replace('.csv', '')
-                            if cluster_name in results:
-                                cluster_data = results[cluster_name]
-                                sub_node['children'].append(cluster_data)
-                        
                         if sub_node['children']:
-                            # Aggregate metrics for subtopic
-                            sub_node = aggregate_node_metrics(sub_node)
                             parent_node['children'].append(sub_node)
                 else:
-                    for cluster_file in sub_items:
-                        if not cluster_file.endswith('.csv'):
-                            continue
-                        
-                        cluster_name = cluster_file.replace('.csv', '')
-                        if cluster_name in results:
-                            cluster_data = results[cluster_name]
-                            parent_node['children'].append(cluster_data)
+                    parent_node['children'] = [results[cluster_file] for cluster_file in parent_layout['clusters']]
                 
                 if parent_node['children']:
-                    # Aggregate metrics for parent
-                    parent_node = aggregate_node_metrics(parent_node)
                     pillar_node['children'].append(parent_node)
             
             if pillar_node['children']:
-                # Aggregate metrics for pillar
-                pillar_node = aggregate_node_metrics(pillar_node)
+                # Aggregate metrics for the pillar and everything below it
+                aggregate_node_metrics(pillar_node)
                 data.append(pillar_node)
         
         # Store structure variations in statistics but don't print them
@@ -452,10 +514,16 @@ def transform_and_save_data():
         # Calculate total keywords across all clusters
         total_keywords = sum(pillar['totalKeywords'] for pillar in result['data'])
         
+        # Keywords stay column-wise until the output is written
+        flatten_keyword_columns(result['data'])
+        
         # Save the transformed data
         output_path = current_dir / 'squarified-ready.json'
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(
+                result,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            ))
         
         print('Data transformation completed successfully!')
         print(f'Output saved to: {output_path}')
@@ -471,6 +539,4 @@ def transform_and_save_data():
         raise
 
 if __name__ == '__main__':
-    # Set pandas to use more memory
-    pd.options.mode.chained_assignment = None
     transform_and_save_data() 
\ No newline at end of file
@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-import json
+import orjson
 import sys
 
 def update_pillar_names(data):
@@ -26,30 +26,46 @@ def update_pillar_names(data):
         "mobile_development": "Mobile Development"
     }
     
-    def update_node(node):
-        """Recursively update node names and pillar fields"""
-        if isinstance(node, dict):
-            # Update name if it's a pillar topic
-            if node.get("type") == "pillar" and "name" in node:
-                old_name = node["name"]
-                if old_name in name_mapping:
-                    node["name"] = name_mapping[old_name]
-                    print(f"Updated: 'name' '{old_name}' → '{name_mapping[old_name]}'")
-            # Update pillar field if it matches
-            if "pillar" in node:
-                old_pillar = node["pillar"]
-                if old_pillar in name_mapping:
-                    node["pillar"] = name_mapping[old_pillar]
-                    print(f"Updated: 'pillar' '{old_pillar}' → '{name_mapping[old_pillar]}'")
-            # Recursively update children
-            for value in node.values():
-                update_node(value)
-        elif isinstance(node, list):
-            for item in node:
-                update_node(item)
+    updates = []
     
-    # Update the data
+    def update_node(root):
+        """Walk the tree and update node names and pillar fields"""
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, dict):
+                # Update name if it's a pillar topic
+                if node.get("type") == "pillar" and "name" in node:
+                    old_name = node["name"]
+                    new_name = name_mapping.get(old_name)
+                    if new_name is not None:
+                        node["name"] = new_name
+                        updates.append(("name", old_name, new_name))
+                # Update pillar field if it matches
+                if "pillar" in node:
+                    old_pillar = node["pillar"]
+                    new_pillar = name_mapping.get(old_pillar)
+                    if new_pillar is not None:
+                        node["pillar"] = new_pillar
+                        updates.append(("pillar", old_pillar, new_pillar))
+                # Queue nested containers in document order; keyword records
+                # never carry pillar names, so their lists are skipped
+                stack.extend(
+                    value for key, value in reversed(node.items())
+                    if key != "keywords" and isinstance(value, (dict, list))
+                )
+            elif isinstance(node, list):
+                stack.extend(
+                    item for item in reversed(node)
+                    if isinstance(item, (dict, list))
+                )
+    
+    # Update the data and report every change in a single write
     update_node(data)
+    if updates:
+        sys.stdout.write("".join(
+            f"Updated: '{field}' '{old}' → '{new}'\n" for field, old, new in updates
+        ))
     return data
 
 def main():
@@ -58,8 +74,8 @@ def main():
     
     print("Reading JSON file...")
     try:
-        with open(input_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(input_file, 'rb') as f:
+            data = orjson.loads(f.read())
     except Exception as e:
         print(f"Error reading file: {e}")
         sys.exit(1)
@@ -69,8 +85,8 @@ def main():
     
     print("Writing updated file...")
     try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(updated_data, f, indent=2, ensure_ascii=False)
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(updated_data, option=orjson.OPT_INDENT_2))
         print("Successfully updated pillar topic names!")
     except Exception as e:
         print(f"Error writing file: {e}")